@@ -0,0 +1,122 @@
+"""
+Measures sustained rate of answer submission through AnswerBatcher.
+
+Requires running database with applied migrations. Run from `app` directory:
+    python -m benchmarks.ingestion --users 1000 --duration 30
+
+Batcher options are read from `v1_ingestion_*` environment variables.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+
+from v1.database.config import DBSettings
+from v1.database.schemas import QuestOrm
+from v1.exceptions.exceptions import ServiceUnavailableError
+from v1.ingestion.batcher import AnswerBatcher
+from v1.ingestion.config import IngestionSettings
+from v1.ingestion.task_cache import VersionTaskCache
+from v1.models.enums.task_type import TaskType
+from v1.routers.completions.controller import CompletionController
+from v1.routers.completions.models.completion import CompletionInput, AnswerInput
+from v1.routers.quests.controller import QuestController
+from v1.routers.quests.models.quest import QuestInput
+
+
+async def create_fixtures(engine, users: int, tasks: int) -> tuple[int, list[int], list[int]]:
+    async with AsyncSession(engine) as session:
+        quest = QuestInput.model_validate({
+            "name": f"benchmark-{uuid.uuid4()}",
+            "tasks": [{"type": TaskType.SINGLE, "question": f"Question {i}?",
+                       "responses": ["yes", "no"], "answers": ["yes"]} for i in range(tasks)],
+        })
+        quest = await QuestController(session=session).create_quest(quest=quest)
+
+        controller = CompletionController(session=session)
+        completions = [await controller.start_completion(CompletionInput(questId=quest.id, user=f"user-{i}"))
+                       for i in range(users)]
+        await session.commit()
+
+    return quest.id, [completion.id for completion in completions], [task.id for task in quest.tasks]
+
+
+async def run_user(engine, batcher, task_cache, completion_id: int, task_ids: list[int],
+                   answers_per_request: int, deadline: float, latencies: list[float]) -> tuple[int, int]:
+    submitted = 0
+    rejected = 0
+    position = 0
+    while time.perf_counter() < deadline:
+        answers = [AnswerInput(taskId=task_ids[(position + i) % len(task_ids)], answer=["yes"])
+                   for i in range(answers_per_request)]
+        position += answers_per_request
+
+        started = time.perf_counter()
+        async with AsyncSession(engine) as session:
+            controller = CompletionController(session=session, batcher=batcher, task_cache=task_cache)
+            try:
+                await controller.submit_answers(completion_id=completion_id, answers=answers)
+            except ServiceUnavailableError:
+                # backpressure, client would retry after a while
+                rejected += 1
+                await asyncio.sleep(0.1)
+                continue
+        latencies.append(time.perf_counter() - started)
+        submitted += len(answers)
+
+    return submitted, rejected
+
+
+async def main(args: argparse.Namespace) -> None:
+    engine = create_async_engine(DBSettings().url, pool_size=args.pool_size, max_overflow=0)
+    settings = IngestionSettings()
+    batcher = AnswerBatcher(engine=engine, settings=settings)
+    task_cache = VersionTaskCache(size=settings.task_cache_size)
+
+    quest_id, completion_ids, task_ids = await create_fixtures(engine, args.users, args.tasks)
+    await batcher.start()
+
+    latencies = []
+    try:
+        started = time.perf_counter()
+        deadline = started + args.duration
+        results = await asyncio.gather(*[
+            run_user(engine, batcher, task_cache, completion_id, task_ids,
+                     args.answers_per_request, deadline, latencies)
+            for completion_id in completion_ids])
+        elapsed = time.perf_counter() - started
+    finally:
+        await batcher.stop()
+        async with AsyncSession(engine) as session:
+            await session.execute(delete(QuestOrm).where(QuestOrm.id == quest_id))
+            await session.commit()
+        await engine.dispose()
+
+    submitted = sum(user_submitted for user_submitted, _ in results)
+    rejected = sum(user_rejected for _, user_rejected in results)
+
+    latencies.sort()
+    print(f"batch_size={settings.batch_size} flush_interval={settings.flush_interval}s "
+          f"max_pending={settings.max_pending} users={args.users} answers_per_request={args.answers_per_request}")
+    print(f"answers: {submitted} in {elapsed:.1f}s, {submitted / elapsed:.0f} answers/s")
+    print(f"rejected requests (503): {rejected}")
+    if latencies:
+        print(f"latency: p50={statistics.median(latencies) * 1000:.1f}ms "
+              f"p99={latencies[int(len(latencies) * 0.99)] * 1000:.1f}ms")
+    else:
+        print("latency: no request was accepted")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=1000, help="number of concurrent users")
+    parser.add_argument("--tasks", type=int, default=20, help="number of tasks in quest")
+    parser.add_argument("--answers-per-request", type=int, default=1)
+    parser.add_argument("--duration", type=float, default=30, help="seconds to run")
+    parser.add_argument("--pool-size", type=int, default=20, help="database connection pool size")
+
+    asyncio.run(main(parser.parse_args()))
@@ -1,9 +1,9 @@
 from fastapi import FastAPI
 
 from config import TITLE
-from v1.main import v1_app
+from v1.main import v1_app, v1_lifespan
 
-app = FastAPI(title=TITLE)
+app = FastAPI(title=TITLE, lifespan=v1_lifespan)
 
 
 app.mount('/v1', v1_app)
@@ -1,11 +1,12 @@
 from datetime import datetime
 
-from sqlalchemy import Integer, String, PrimaryKeyConstraint, UniqueConstraint, Text, ForeignKeyConstraint
+from sqlalchemy import Integer, String, PrimaryKeyConstraint, UniqueConstraint, Text, ForeignKeyConstraint, Index
 from sqlalchemy.dialects.postgresql import TIMESTAMP
 from sqlalchemy.orm import DeclarativeBase, Mapped
 from sqlalchemy.testing.schema import mapped_column
 
 from v1.database.functions import utc_now
+from v1.models.enums.job_status import JobStatus
 from v1.models.enums.quest_status import QuestStatus
 from v1.models.enums.task_type import TaskType
 
@@ -20,6 +21,7 @@ class QuestOrm(Base):
     id: Mapped[int] = mapped_column(Integer)
     name: Mapped[str] = mapped_column(String(128), nullable=False)
     description: Mapped[str] = mapped_column(String(256), nullable=True)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
 
     __table_args__ = (
         PrimaryKeyConstraint('id', name='quest_pkey'),
@@ -27,11 +29,30 @@ class QuestOrm(Base):
     )
 
 
+class QuestVersionOrm(Base):
+    __tablename__ = "quest_version"
+
+    id: Mapped[int] = mapped_column(Integer)
+    quest_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    version: Mapped[int] = mapped_column(Integer, nullable=False)
+    name: Mapped[str] = mapped_column(String(128), nullable=False)
+    description: Mapped[str] = mapped_column(String(256), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=False, server_default=utc_now())
+
+    __table_args__ = (
+        PrimaryKeyConstraint('id', name='quest_version_pkey'),
+        ForeignKeyConstraint(['quest_id'], ['quest.id'], name='quest_version_quest_fkey',
+                             ondelete="CASCADE", onupdate="CASCADE"),
+        UniqueConstraint('quest_id', 'version', name='quest_version_uc'),
+    )
+
+
 class TaskOrm(Base):
     __tablename__ = "task"
 
     id: Mapped[int] = mapped_column(Integer)
     quest_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    version: Mapped[int] = mapped_column(Integer, nullable=False)
     order: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
     type: Mapped[str] = mapped_column(String(16), nullable=False, default=TaskType.TEXT,
                                       server_default=TaskType.TEXT)
@@ -43,7 +64,9 @@ class TaskOrm(Base):
         PrimaryKeyConstraint('id', name='task_pkey'),
         ForeignKeyConstraint(['quest_id'], ['quest.id'], name='task_quest_fkey',
                              ondelete="CASCADE", onupdate="CASCADE"),
-        UniqueConstraint('quest_id', 'question', name='task_question_uc'),
+        ForeignKeyConstraint(['quest_id', 'version'], ['quest_version.quest_id', 'quest_version.version'],
+                             name='task_quest_version_fkey', ondelete="CASCADE", onupdate="CASCADE"),
+        UniqueConstraint('quest_id', 'version', 'question', name='task_question_uc'),
     )
 
 
@@ -52,6 +75,7 @@ class CompletionOrm(Base):
 
     id: Mapped[int] = mapped_column(Integer)
     quest_id: Mapped[int] = mapped_column(Integer)
+    quest_version: Mapped[int] = mapped_column(Integer, nullable=False)
     user: Mapped[str] = mapped_column(Text, nullable=False)
     time_took: Mapped[int] = mapped_column(Integer, nullable=False)
     rate: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
@@ -64,6 +88,8 @@ class CompletionOrm(Base):
         PrimaryKeyConstraint('id', name="completion_pkey"),
         ForeignKeyConstraint(['quest_id'], ['quest.id'], name="completion_quest_fkey",
                              ondelete="CASCADE", onupdate="CASCADE"),
+        ForeignKeyConstraint(['quest_id', 'quest_version'], ['quest_version.quest_id', 'quest_version.version'],
+                             name="completion_quest_version_fkey", ondelete="CASCADE", onupdate="CASCADE"),
         UniqueConstraint('quest_id', 'user', name="completion_quest_user_uc"),
     )
 
@@ -84,3 +110,40 @@ class TaskCompletionOrm(Base):
                              ondelete="CASCADE", onupdate="CASCADE"),
         UniqueConstraint('completion_id', 'task_id', name="task_completion_uc"),
     )
+
+
+class JobOrm(Base):
+    __tablename__ = "job"
+
+    id: Mapped[int] = mapped_column(Integer)
+    type: Mapped[str] = mapped_column(String(32), nullable=False)
+    payload: Mapped[str] = mapped_column(Text, nullable=False, default="{}", server_default="{}")
+    status: Mapped[str] = mapped_column(String(16), nullable=False, default=JobStatus.QUEUED,
+                                        server_default=JobStatus.QUEUED)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=5, server_default="5")
+    last_error: Mapped[str] = mapped_column(Text, nullable=True)
+    run_at: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=False, server_default=utc_now())
+    locked_at: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=False, server_default=utc_now())
+    finished_at: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=True)
+
+    __table_args__ = (
+        PrimaryKeyConstraint('id', name="job_pkey"),
+        Index('job_status_run_at_idx', 'status', 'run_at'),
+    )
+
+
+class ImageOrm(Base):
+    __tablename__ = "image"
+
+    digest: Mapped[str] = mapped_column(String(64))
+    content_type: Mapped[str] = mapped_column(String(32), nullable=False)
+    size: Mapped[int] = mapped_column(Integer, nullable=False)
+    width: Mapped[int] = mapped_column(Integer, nullable=False)
+    height: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=False, server_default=utc_now())
+
+    __table_args__ = (
+        PrimaryKeyConstraint('digest', name="image_pkey"),
+    )
@@ -15,3 +15,11 @@ class DuplicateError(CustomError):
 
 class ResourceNotFoundError(CustomError):
     status_code = status.HTTP_404_NOT_FOUND
+
+
+class PayloadTooLargeError(CustomError):
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+
+class ServiceUnavailableError(CustomError):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
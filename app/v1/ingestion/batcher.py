@@ -0,0 +1,172 @@
+import asyncio
+import logging
+
+from sqlalchemy import select, values, column, Integer, Text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from v1.database.schemas import CompletionOrm, TaskCompletionOrm
+from v1.exceptions.exceptions import CustomError, ServiceUnavailableError, ValidationError, PayloadTooLargeError
+from v1.ingestion.config import IngestionSettings
+from v1.models.enums.quest_status import QuestStatus
+
+logger = logging.getLogger(__name__)
+
+
+class AnswerBatcher:
+    """
+    Write-behind buffer for task answers.
+    Answers of concurrent requests are collected and written with a single multi-row
+    INSERT per transaction. Each request waits until its answers are committed,
+    so acknowledged answers are durable while commit cost is shared by the whole batch.
+    """
+
+    def __init__(self,
+                 engine: AsyncEngine,
+                 settings: IngestionSettings,
+                 ):
+        self.engine = engine
+        self.settings = settings
+        self._entries: list[tuple[list[dict], asyncio.Future]] = []
+        self._pending = 0
+        self._wakeup = asyncio.Event()
+        self._closed = True
+        self._task: asyncio.Task | None = None
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def start(self) -> None:
+        self._closed = False
+        self._task = asyncio.create_task(self._run(), name="answer-batcher")
+
+    async def stop(self) -> None:
+        # stop accepting answers and flush everything already accepted
+        self._closed = True
+        self._wakeup.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+    async def submit(self, rows: list[dict]) -> None:
+        """
+        Queues task_completion rows and waits until they are committed
+        :param rows: values of task_completion rows
+        """
+        if len(rows) > self.settings.max_pending:
+            raise PayloadTooLargeError(f"At most {self.settings.max_pending} answers can be submitted at once!")
+        if self._closed:
+            raise ServiceUnavailableError("Answers are not accepted right now, retry later!")
+        if self._pending + len(rows) > self.settings.max_pending:
+            raise ServiceUnavailableError("Too many pending answers, retry later!")
+
+        future = asyncio.get_running_loop().create_future()
+        self._entries.append((rows, future))
+        self._pending += len(rows)
+        if self._pending >= self.settings.batch_size:
+            self._wakeup.set()
+
+        # client disconnect must not cancel future shared with flusher
+        await asyncio.shield(future)
+
+    async def _run(self) -> None:
+        while not (self._closed and not self._entries):
+            if not self._closed and self._pending < self.settings.batch_size:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.settings.flush_interval)
+                except TimeoutError:
+                    pass
+            self._wakeup.clear()
+
+            if self._entries:
+                await self._flush(self._take_batch())
+
+    def _take_batch(self) -> list[tuple[list[dict], asyncio.Future]]:
+        # answers of one request always go into the same batch
+        size = 0
+        count = 0
+        for rows, _ in self._entries:
+            if count and size + len(rows) > self.settings.batch_size:
+                break
+            size += len(rows)
+            count += 1
+
+        batch, self._entries = self._entries[:count], self._entries[count:]
+        self._pending -= size
+
+        return batch
+
+    async def _flush(self, batch: list[tuple[list[dict], asyncio.Future]]) -> None:
+        try:
+            written = await self._write([row for rows, _ in batch for row in rows])
+        except IntegrityError:
+            # some request references deleted task, find it without failing the others
+            for rows, future in batch:
+                try:
+                    written = await self._write(rows)
+                except IntegrityError:
+                    self._resolve(future, ValidationError("Answers reference not existing task!"))
+                except Exception:
+                    logger.exception("Failed to write answers")
+                    self._resolve(future, CustomError("Failed to save answers!"))
+                else:
+                    self._resolve_written(rows, future, written)
+        except Exception:
+            logger.exception("Failed to write batch of %s answers", len(batch))
+            for _, future in batch:
+                self._resolve(future, CustomError("Failed to save answers!"))
+        else:
+            for rows, future in batch:
+                self._resolve_written(rows, future, written)
+
+    async def _write(self, rows: list[dict]) -> set[tuple[int, int]]:
+        """
+        Writes answers of completions which are still in progress
+        :param rows: values of task_completion rows
+        :return: (completion_id, task_id) of written rows
+        """
+        # multi-row INSERT ON CONFLICT can not touch the same row twice, the latest answer wins
+        rows = list({(row["completion_id"], row["task_id"]): row for row in rows}.values())
+
+        answers = (values(column("completion_id", Integer), column("task_id", Integer), column("answer", Text),
+                          name="answers")
+                   .data([(row["completion_id"], row["task_id"], row["answer"]) for row in rows]))
+        # FOR SHARE waits for concurrent finish of completion and rechecks its status afterwards
+        selected = (select(answers.c.completion_id, answers.c.task_id, answers.c.answer)
+                    .join(CompletionOrm, CompletionOrm.id == answers.c.completion_id)
+                    .where(CompletionOrm.status == QuestStatus.IN_PROGRESS)
+                    .with_for_update(read=True, of=CompletionOrm))
+
+        query = insert(TaskCompletionOrm).from_select(["completion_id", "task_id", "answer"], selected)
+        query = (query.on_conflict_do_update(constraint="task_completion_uc",
+                                             set_={"answer": query.excluded.answer})
+                 .returning(TaskCompletionOrm.completion_id, TaskCompletionOrm.task_id))
+
+        async with AsyncSession(self.engine) as session:
+            written = await session.execute(query)
+            written = set(written.tuples().all())
+            await session.commit()
+
+        return written
+
+    def _resolve_written(self,
+                         rows: list[dict],
+                         future: asyncio.Future,
+                         written: set[tuple[int, int]],
+                         ) -> None:
+        if all((row["completion_id"], row["task_id"]) in written for row in rows):
+            self._resolve(future)
+        else:
+            self._resolve(future, ValidationError("Completion is already finished!"))
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, exc: Exception | None = None) -> None:
+        if future.done():
+            return
+
+        if exc is None:
+            future.set_result(None)
+        else:
+            future.set_exception(exc)
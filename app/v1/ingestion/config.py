@@ -0,0 +1,12 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class IngestionSettings(BaseSettings):
+    # every answer takes 3 query parameters, asyncpg accepts at most 32767 of them
+    batch_size: int = Field(default=500, gt=0, le=10000)
+    flush_interval: float = Field(default=0.05, gt=0)
+    max_pending: int = Field(default=50000, gt=0)
+    task_cache_size: int = Field(default=1024, gt=0)
+
+    model_config = SettingsConfigDict(env_prefix="v1_ingestion_")
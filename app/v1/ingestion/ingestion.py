@@ -0,0 +1,17 @@
+from v1.database.database import engine
+from v1.ingestion.batcher import AnswerBatcher
+from v1.ingestion.config import IngestionSettings
+from v1.ingestion.task_cache import VersionTaskCache
+
+
+settings = IngestionSettings()
+answer_batcher = AnswerBatcher(engine=engine, settings=settings)
+task_cache = VersionTaskCache(size=settings.task_cache_size)
+
+
+def get_answer_batcher() -> AnswerBatcher:
+    return answer_batcher
+
+
+def get_task_cache() -> VersionTaskCache:
+    return task_cache
@@ -0,0 +1,27 @@
+from collections import OrderedDict
+
+from v1.routers.quests.models.tasks import TaskOutput
+
+
+class VersionTaskCache:
+    """
+    LRU cache of quest version tasks.
+    Quest versions are immutable, so cached tasks never have to be invalidated
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._tasks: OrderedDict[tuple[int, int], dict[int, TaskOutput]] = OrderedDict()
+
+    def get(self, quest_id: int, version: int) -> dict[int, TaskOutput] | None:
+        tasks = self._tasks.get((quest_id, version))
+        if tasks is not None:
+            self._tasks.move_to_end((quest_id, version))
+
+        return tasks
+
+    def put(self, quest_id: int, version: int, tasks: dict[int, TaskOutput]) -> None:
+        self._tasks[(quest_id, version)] = tasks
+        self._tasks.move_to_end((quest_id, version))
+        while len(self._tasks) > self.size:
+            self._tasks.popitem(last=False)
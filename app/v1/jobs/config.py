@@ -0,0 +1,14 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class JobSettings(BaseSettings):
+    enabled: bool = Field(default=True)
+    concurrency: int = Field(default=4, gt=0)
+    poll_interval: float = Field(default=1.0, gt=0)
+    lock_timeout: int = Field(default=300, gt=0)
+    max_attempts: int = Field(default=5, gt=0)
+    backoff_base: float = Field(default=2.0, gt=0)
+    backoff_max: float = Field(default=300.0, gt=0)
+
+    model_config = SettingsConfigDict(env_prefix="v1_jobs_")
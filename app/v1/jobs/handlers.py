@@ -0,0 +1,58 @@
+import json
+from typing import Awaitable, Callable
+
+from sqlalchemy import select, delete, update, bindparam
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from v1.database.schemas import QuestOrm, TaskOrm, CompletionOrm, TaskCompletionOrm
+from v1.models.enums.job_type import JobType
+from v1.routers.quests.models.tasks import is_answer_correct
+
+
+async def delete_quest(session: AsyncSession, quest_id: int) -> None:
+    """
+    Deletes quest together with its tasks and completions
+    :param session: session of the job transaction
+    :param quest_id: id of quest to delete
+    """
+    await session.execute(delete(QuestOrm).where(QuestOrm.id == quest_id))
+
+
+async def recompute_rates(session: AsyncSession, quest_id: int) -> None:
+    """
+    Recalculates rate (number of correct answers) of every completion of quest
+    :param session: session of the job transaction
+    :param quest_id: id of quest which completions should be recalculated
+    """
+    query = select(TaskOrm.id, TaskOrm.answers).where(TaskOrm.quest_id == quest_id)
+    tasks = await session.execute(query)
+    answers = {task_id: json.loads(task_answers) for task_id, task_answers in tasks.all()}
+
+    query = select(CompletionOrm.id).where(CompletionOrm.quest_id == quest_id)
+    completions = await session.execute(query)
+    rates = {completion_id: 0 for completion_id in completions.scalars().all()}
+
+    if not rates:
+        return
+
+    query = (select(TaskCompletionOrm.completion_id, TaskCompletionOrm.task_id, TaskCompletionOrm.answer)
+             .join(CompletionOrm, CompletionOrm.id == TaskCompletionOrm.completion_id)
+             .where(CompletionOrm.quest_id == quest_id))
+    task_completions = await session.execute(query)
+    for completion_id, task_id, answer in task_completions.all():
+        if task_id in answers and is_answer_correct(answers[task_id], json.loads(answer)):
+            rates[completion_id] += 1
+
+    # executemany; submitted_at is set explicitly, otherwise its onupdate would overwrite it
+    completion = CompletionOrm.__table__
+    query = (update(completion)
+             .where(completion.c.id == bindparam("completion_id"))
+             .values(rate=bindparam("new_rate"), submitted_at=completion.c.submitted_at))
+    await session.execute(query, [{"completion_id": completion_id, "new_rate": rate}
+                                  for completion_id, rate in rates.items()])
+
+
+JOB_HANDLERS: dict[str, Callable[..., Awaitable[None]]] = {
+    JobType.DELETE_QUEST: delete_quest,
+    JobType.RECOMPUTE_RATES: recompute_rates,
+}
@@ -0,0 +1,167 @@
+import asyncio
+import json
+import logging
+from datetime import timedelta
+
+from sqlalchemy import select, update, or_, and_
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from v1.database.functions import utc_now
+from v1.database.schemas import JobOrm
+from v1.jobs.config import JobSettings
+from v1.jobs.handlers import JOB_HANDLERS
+from v1.models.enums.job_status import JobStatus
+
+logger = logging.getLogger(__name__)
+
+
+class JobWorker:
+    """
+    Runs queued jobs inside of app process.
+    Jobs are claimed with `FOR UPDATE SKIP LOCKED`, so any number of workers
+    on any number of nodes can poll the same table without blocking each other.
+    """
+
+    def __init__(self,
+                 engine: AsyncEngine,
+                 settings: JobSettings,
+                 ):
+        self.engine = engine
+        self.settings = settings
+        self._stopping = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+
+    async def start(self) -> None:
+        self._stopping.clear()
+        self._tasks = [asyncio.create_task(self._run(), name=f"job-worker-{i}")
+                       for i in range(self.settings.concurrency)]
+
+    async def stop(self) -> None:
+        # let in-flight jobs finish, idle loops wake up immediately
+        self._stopping.set()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                job = await self.claim()
+            except Exception:
+                logger.exception("Failed to claim job")
+                job = None
+
+            if job is None:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.settings.poll_interval)
+                except TimeoutError:
+                    pass
+                continue
+
+            await self.execute(job)
+
+    async def claim(self) -> JobOrm | None:
+        """
+        Locks next due job and marks it as running
+        :return: claimed job or None if queue is empty
+        """
+        stale_before = utc_now() - timedelta(seconds=self.settings.lock_timeout)
+        candidate = (select(JobOrm.id)
+                     .where(or_(and_(JobOrm.status == JobStatus.QUEUED, JobOrm.run_at <= utc_now()),
+                                # job of crashed worker
+                                and_(JobOrm.status == JobStatus.RUNNING, JobOrm.locked_at < stale_before)))
+                     .order_by(JobOrm.run_at, JobOrm.id)
+                     .limit(1)
+                     .with_for_update(skip_locked=True)
+                     .scalar_subquery())
+        query = (update(JobOrm)
+                 .where(JobOrm.id == candidate)
+                 .values(status=JobStatus.RUNNING, attempts=JobOrm.attempts + 1, locked_at=utc_now())
+                 .returning(JobOrm)
+                 .execution_options(synchronize_session=False))
+
+        async with AsyncSession(self.engine, expire_on_commit=False) as session:
+            job = await session.execute(query)
+            job = job.scalar()
+            await session.commit()
+
+        return job
+
+    async def execute(self, job: JobOrm) -> None:
+        """
+        Runs job handler and marks job as succeeded in the same transaction,
+        so handler changes are committed only together with job status
+        :param job: claimed job
+        """
+        try:
+            handler = JOB_HANDLERS.get(job.type)
+            if handler is None:
+                raise ValueError(f"Unknown job type '{job.type}'!")
+            if job.attempts > job.max_attempts:
+                raise RuntimeError("Job exceeded max attempts!")
+
+            async with AsyncSession(self.engine) as session:
+                stop_heartbeat = asyncio.Event()
+                heartbeat = asyncio.create_task(self._heartbeat(job, stop_heartbeat))
+                try:
+                    await handler(session, **json.loads(job.payload))
+                finally:
+                    stop_heartbeat.set()
+                    await heartbeat
+
+                query = (update(JobOrm)
+                         # attempts guard against job being reclaimed by other worker meanwhile
+                         .where(JobOrm.id == job.id, JobOrm.attempts == job.attempts)
+                         .values(status=JobStatus.SUCCEEDED, finished_at=utc_now(), last_error=None)
+                         .execution_options(synchronize_session=False))
+                result = await session.execute(query)
+                if result.rowcount == 0:
+                    await session.rollback()
+                    logger.warning("Job %s was reclaimed by other worker", job.id)
+                    return
+
+                await session.commit()
+        except Exception as exc:
+            logger.exception("Job %s (%s) failed on attempt %s", job.id, job.type, job.attempts)
+            await self._fail(job, exc)
+
+    async def _heartbeat(self, job: JobOrm, stop: asyncio.Event) -> None:
+        # keeps long running job from being reclaimed as job of crashed worker
+        interval = self.settings.lock_timeout / 3
+        query = (update(JobOrm)
+                 .where(JobOrm.id == job.id, JobOrm.attempts == job.attempts)
+                 .values(locked_at=utc_now())
+                 .execution_options(synchronize_session=False))
+
+        while True:
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=interval)
+                return
+            except TimeoutError:
+                pass
+
+            try:
+                async with AsyncSession(self.engine) as session:
+                    await session.execute(query)
+                    await session.commit()
+            except Exception:
+                logger.exception("Failed to refresh lock of job %s", job.id)
+
+    async def _fail(self, job: JobOrm, exc: Exception) -> None:
+        values = {"last_error": repr(exc), "locked_at": None}
+        if job.attempts < job.max_attempts:
+            delay = min(self.settings.backoff_base * 2 ** (job.attempts - 1), self.settings.backoff_max)
+            values |= {"status": JobStatus.QUEUED, "run_at": utc_now() + timedelta(seconds=delay)}
+        else:
+            values |= {"status": JobStatus.FAILED, "finished_at": utc_now()}
+
+        query = (update(JobOrm)
+                 .where(JobOrm.id == job.id, JobOrm.attempts == job.attempts)
+                 .values(**values)
+                 .execution_options(synchronize_session=False))
+
+        try:
+            async with AsyncSession(self.engine) as session:
+                await session.execute(query)
+                await session.commit()
+        except Exception:
+            logger.exception("Failed to update status of job %s", job.id)
@@ -1,11 +1,39 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from config import TITLE
+from v1.database.database import engine
+from v1.ingestion.ingestion import answer_batcher
+from v1.jobs.config import JobSettings
+from v1.jobs.worker import JobWorker
+from v1.routers.completions.router import completion_router
+from v1.routers.images.router import image_router
+from v1.routers.jobs.router import job_router
 from v1.routers.quests.router import quest_router
 
+
+@asynccontextmanager
+async def v1_lifespan(app: FastAPI):
+    # mounted apps do not receive lifespan events, so root app has to pass it
+    settings = JobSettings()
+    worker = JobWorker(engine=engine, settings=settings)
+    if settings.enabled:
+        await worker.start()
+    await answer_batcher.start()
+
+    yield
+
+    await answer_batcher.stop()
+    await worker.stop()
+
+
 v1_app = FastAPI(title=TITLE, version="1",
                  openapi_url='/openapi.json',
                  docs_url='/docs')
 
 
 v1_app.include_router(quest_router, prefix='/quests')
+v1_app.include_router(job_router, prefix='/jobs')
+v1_app.include_router(image_router, prefix='/images')
+v1_app.include_router(completion_router, prefix='/completions')
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class JobType(str, Enum):
+    DELETE_QUEST = "delete_quest"
+    RECOMPUTE_RATES = "recompute_rates"
@@ -0,0 +1,18 @@
+from starlette.requests import Request
+
+# content which never changes under the same url
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# content which may be cached, but has to be revalidated on every use
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """
+    Checks if client already has representation with given ETag
+    :param request: incoming request
+    :param etag: quoted ETag of current representation
+    :return: True if 304 response can be sent
+    """
+    if_none_match = request.headers.get("if-none-match", "")
+
+    return if_none_match == "*" or etag in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
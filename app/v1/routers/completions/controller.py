@@ -0,0 +1,148 @@
+import json
+
+from sqlalchemy import select, func, cast, Integer
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from v1.database.functions import utc_now
+from v1.database.schemas import QuestOrm, TaskOrm, CompletionOrm, TaskCompletionOrm
+from v1.exceptions.exceptions import DuplicateError, ValidationError, ResourceNotFoundError
+from v1.ingestion.batcher import AnswerBatcher
+from v1.ingestion.task_cache import VersionTaskCache
+from v1.models.enums.quest_status import QuestStatus
+from v1.models.enums.task_type import TaskType
+from v1.routers.completions.models.completion import CompletionInput, CompletionOutput, AnswerInput
+from v1.routers.quests.models.tasks import TaskOutput, is_answer_correct
+
+
+class CompletionController:
+    def __init__(self,
+                 session: AsyncSession,
+                 batcher: AnswerBatcher | None = None,
+                 task_cache: VersionTaskCache | None = None,
+                 ):
+        self.session = session
+        self.batcher = batcher
+        self.task_cache = task_cache
+
+    async def start_completion(self,
+                               completion: CompletionInput,
+                               ) -> CompletionOutput:
+        """
+        Starts completion of latest quest version by user
+        :param completion: quest and user info
+        :return: created completion
+        """
+        query = select(QuestOrm.version).where(QuestOrm.id == completion.quest_id)
+        version = await self.session.execute(query)
+        version = version.scalar()
+
+        if not version:
+            raise ResourceNotFoundError("Quest with given id not exist!")
+
+        completion_db = CompletionOrm(quest_id=completion.quest_id, quest_version=version,
+                                      user=completion.user, time_took=0)
+
+        try:
+            self.session.add(completion_db)
+            await self.session.flush()
+            await self.session.refresh(completion_db)
+        except IntegrityError:
+            raise DuplicateError("User already started this quest!")
+
+        return CompletionOutput.model_validate(completion_db)
+
+    async def get_completion(self, completion_id: int) -> CompletionOutput:
+        completion = await self.session.get(CompletionOrm, completion_id)
+
+        if not completion:
+            raise ResourceNotFoundError("Completion with given id not exist!")
+
+        return CompletionOutput.model_validate(completion)
+
+    async def submit_answers(self,
+                             completion_id: int,
+                             answers: list[AnswerInput],
+                             ) -> None:
+        """
+        Validates answers and waits until they are written by batcher
+        :param completion_id: id of completion in progress
+        :param answers: answers to tasks of completion quest version
+        """
+        query = (select(CompletionOrm.quest_id, CompletionOrm.quest_version, CompletionOrm.status)
+                 .where(CompletionOrm.id == completion_id))
+        completion = await self.session.execute(query)
+        completion = completion.first()
+
+        if not completion:
+            raise ResourceNotFoundError("Completion with given id not exist!")
+
+        quest_id, version, status = completion
+        if status != QuestStatus.IN_PROGRESS:
+            raise ValidationError("Completion is already finished!")
+
+        tasks = await self._get_version_tasks(quest_id, version)
+
+        # return connection to pool, it is not needed while batch is being flushed
+        await self.session.close()
+
+        rows = []
+        for answer in answers:
+            task = tasks.get(answer.task_id)
+            if task is None:
+                raise ValidationError(f"Task {answer.task_id} does not belong to completed quest!")
+
+            self._check_answer(task, answer.answer)
+            rows.append({"completion_id": completion_id, "task_id": task.id, "answer": json.dumps(answer.answer)})
+
+        await self.batcher.submit(rows)
+
+    async def finish_completion(self, completion_id: int) -> CompletionOutput:
+        """
+        Marks completion as completed and calculates its rate
+        :param completion_id: id of completion in progress
+        :return: finished completion
+        """
+        query = select(CompletionOrm).where(CompletionOrm.id == completion_id).with_for_update()
+        completion = await self.session.execute(query)
+        completion = completion.scalar()
+
+        if not completion:
+            raise ResourceNotFoundError("Completion with given id not exist!")
+        if completion.status != QuestStatus.IN_PROGRESS:
+            raise ValidationError("Completion is already finished!")
+
+        query = (select(TaskOrm.answers, TaskCompletionOrm.answer)
+                 .join(TaskOrm, TaskOrm.id == TaskCompletionOrm.task_id)
+                 .where(TaskCompletionOrm.completion_id == completion_id))
+        answers = await self.session.execute(query)
+
+        completion.rate = sum(is_answer_correct(json.loads(task_answers), json.loads(answer))
+                              for task_answers, answer in answers.all())
+        completion.status = QuestStatus.COMPLETED
+        completion.time_took = cast(func.extract('epoch', utc_now() - CompletionOrm.created_at), Integer)
+        await self.session.flush()
+        await self.session.refresh(completion)
+
+        return CompletionOutput.model_validate(completion)
+
+    async def _get_version_tasks(self, quest_id: int, version: int) -> dict[int, TaskOutput]:
+        tasks = self.task_cache.get(quest_id, version)
+        if tasks is not None:
+            return tasks
+
+        query = select(TaskOrm).where(TaskOrm.quest_id == quest_id, TaskOrm.version == version)
+        tasks = await self.session.execute(query)
+        tasks = {task.id: TaskOutput.model_validate(task) for task in tasks.scalars().all()}
+        self.task_cache.put(quest_id, version, tasks)
+
+        return tasks
+
+    @staticmethod
+    def _check_answer(task: TaskOutput, answer: list[str]) -> None:
+        if task.type in (TaskType.TEXT, TaskType.SINGLE, TaskType.IMAGE) and len(answer) != 1:
+            raise ValidationError(f"Task {task.id} accepts only 1 answer!")
+        if len(set(answer)) != len(answer):
+            raise ValidationError(f"Task {task.id} answer contains duplicates!")
+        if task.type != TaskType.TEXT and any(item not in task.responses for item in answer):
+            raise ValidationError(f"Task {task.id} answer must be one of responses!")
@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field, ConfigDict
+
+from v1.models.enums.quest_status import QuestStatus
+
+
+class CompletionInput(BaseModel):
+    quest_id: int = Field(alias="questId", gt=0)
+    user: str = Field(min_length=1)
+
+
+class CompletionOutput(BaseModel):
+    id: int = Field(gt=0)
+    quest_id: int = Field(alias="questId", gt=0)
+    quest_version: int = Field(alias="questVersion", gt=0)
+    user: str
+    status: QuestStatus
+    rate: int = Field(ge=0)
+    time_took: int = Field(alias="timeTook", ge=0)
+    created_at: datetime = Field(alias="createdAt")
+    submitted_at: datetime | None = Field(alias="submittedAt", default=None)
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+
+class AnswerInput(BaseModel):
+    task_id: int = Field(alias="taskId", gt=0)
+    answer: list[str] = Field(min_length=1)
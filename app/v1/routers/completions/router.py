@@ -0,0 +1,73 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Body, HTTPException, Path, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from v1.database.database import get_session
+from v1.exceptions.exceptions import CustomError
+from v1.ingestion.batcher import AnswerBatcher
+from v1.ingestion.ingestion import get_answer_batcher, get_task_cache
+from v1.ingestion.task_cache import VersionTaskCache
+from v1.routers.completions.controller import CompletionController
+from v1.routers.completions.models.completion import CompletionInput, CompletionOutput, AnswerInput
+
+completion_router = APIRouter(tags=["Quest Completions"])
+
+
+@completion_router.post('/', status_code=status.HTTP_201_CREATED)
+async def start_completion(session: Annotated[AsyncSession, Depends(get_session)],
+                           completion: Annotated[CompletionInput, Body()],
+                           ) -> CompletionOutput:
+    controller = CompletionController(session=session)
+
+    try:
+        result = await controller.start_completion(completion=completion)
+        await session.commit()
+    except CustomError as exc:
+        raise HTTPException(status_code=exc.status_code, detail=str(exc))
+
+    return result
+
+
+@completion_router.get('/{completion_id}')
+async def get_completion(session: Annotated[AsyncSession, Depends(get_session)],
+                         completion_id: Annotated[int, Path(gt=0)],
+                         ) -> CompletionOutput:
+    controller = CompletionController(session=session)
+
+    try:
+        result = await controller.get_completion(completion_id=completion_id)
+    except CustomError as exc:
+        raise HTTPException(status_code=exc.status_code, detail=str(exc))
+
+    return result
+
+
+@completion_router.post('/{completion_id}/answers', status_code=status.HTTP_204_NO_CONTENT)
+async def submit_answers(session: Annotated[AsyncSession, Depends(get_session)],
+                         batcher: Annotated[AnswerBatcher, Depends(get_answer_batcher)],
+                         task_cache: Annotated[VersionTaskCache, Depends(get_task_cache)],
+                         completion_id: Annotated[int, Path(gt=0)],
+                         answers: Annotated[list[AnswerInput], Body(min_length=1)],
+                         ) -> None:
+    controller = CompletionController(session=session, batcher=batcher, task_cache=task_cache)
+
+    try:
+        await controller.submit_answers(completion_id=completion_id, answers=answers)
+    except CustomError as exc:
+        raise HTTPException(status_code=exc.status_code, detail=str(exc))
+
+
+@completion_router.post('/{completion_id}/submit')
+async def finish_completion(session: Annotated[AsyncSession, Depends(get_session)],
+                            completion_id: Annotated[int, Path(gt=0)],
+                            ) -> CompletionOutput:
+    controller = CompletionController(session=session)
+
+    try:
+        result = await controller.finish_completion(completion_id=completion_id)
+        await session.commit()
+    except CustomError as exc:
+        raise HTTPException(status_code=exc.status_code, detail=str(exc))
+
+    return result
@@ -0,0 +1,86 @@
+from pathlib import Path
+from typing import AsyncIterator
+
+from PIL import Image
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from v1.database.schemas import ImageOrm
+from v1.exceptions.exceptions import ValidationError, ResourceNotFoundError
+from v1.routers.images.models.image import ImageOutput
+from v1.storage.blob_store import BlobStore
+from v1.storage.config import StorageSettings
+
+ALLOWED_FORMATS = {"JPEG", "PNG", "GIF", "WEBP"}
+
+
+class ImageController:
+    def __init__(self,
+                 session: AsyncSession,
+                 store: BlobStore,
+                 ):
+        self.session = session
+        self.store = store
+
+    async def upload_image(self, chunks: AsyncIterator[bytes]) -> ImageOutput:
+        """
+        Saves image into blob store. Uploading the same image again returns existing one
+        :param chunks: raw image bytes
+        :return: stored image info
+        """
+        digest, size, tmp_path = await self.store.stage(chunks, max_size=StorageSettings().max_image_size)
+
+        try:
+            content_type, width, height = await run_in_threadpool(self._inspect_image, tmp_path)
+        except ValidationError:
+            self.store.discard(tmp_path)
+            raise
+
+        self.store.commit(digest, tmp_path)
+
+        query = (insert(ImageOrm)
+                 .values(digest=digest, content_type=content_type, size=size, width=width, height=height)
+                 .on_conflict_do_nothing(index_elements=[ImageOrm.digest]))
+        await self.session.execute(query)
+
+        image = await self.session.get(ImageOrm, digest)
+
+        return ImageOutput.model_validate(image)
+
+    async def get_image(self, digest: str) -> tuple[ImageOutput, Path]:
+        image = await self.session.get(ImageOrm, digest)
+        path = self.store.blob_path(digest)
+
+        if not image or not path.exists():
+            raise ResourceNotFoundError("Image with given digest not exist!")
+
+        return ImageOutput.model_validate(image), path
+
+    async def get_thumbnail(self, digest: str, width: int) -> Path:
+        """
+        Returns thumbnail of image, it is rendered once and cached on disk
+        :param digest: digest of source image
+        :param width: thumbnail width, must be one of configured widths
+        :return: path of thumbnail
+        """
+        if width not in StorageSettings().thumbnail_widths:
+            raise ValidationError("Unsupported thumbnail width!")
+
+        await self.get_image(digest)
+
+        return await self.store.thumbnail(digest, width)
+
+    @staticmethod
+    def _inspect_image(path: Path) -> tuple[str, int, int]:
+        try:
+            with Image.open(path) as image:
+                image_format, width, height = image.format, image.width, image.height
+                image.verify()
+        except Exception:
+            raise ValidationError("File is not a valid image!")
+
+        if image_format not in ALLOWED_FORMATS:
+            raise ValidationError("Unsupported image format!")
+
+        return Image.MIME[image_format], width, height
@@ -0,0 +1,13 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field, ConfigDict
+
+
+class ImageOutput(BaseModel):
+    digest: str = Field(min_length=64, max_length=64)
+    content_type: str = Field(alias="contentType")
+    size: int = Field(gt=0)
+    width: int = Field(gt=0)
+    height: int = Field(gt=0)
+    created_at: datetime = Field(alias="createdAt")
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
@@ -0,0 +1,69 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, HTTPException, Path, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from v1.database.database import get_session
+from v1.exceptions.exceptions import CustomError
+from v1.routers.images.controller import ImageController
+from v1.routers.images.models.image import ImageOutput
+from v1.storage.blob_store import BlobStore
+from v1.storage.responses import immutable_file_response
+from v1.storage.storage import get_blob_store
+
+image_router = APIRouter(tags=["Images"])
+
+DIGEST_PATTERN = "^[0-9a-f]{64}$"
+
+
+@image_router.post('/', status_code=status.HTTP_201_CREATED,
+                   openapi_extra={"requestBody": {
+                       "required": True,
+                       "content": {"image/*": {"schema": {"type": "string", "format": "binary"}}},
+                   }})
+async def upload_image(session: Annotated[AsyncSession, Depends(get_session)],
+                       store: Annotated[BlobStore, Depends(get_blob_store)],
+                       request: Request,
+                       ) -> ImageOutput:
+    controller = ImageController(session=session, store=store)
+
+    try:
+        result = await controller.upload_image(chunks=request.stream())
+        await session.commit()
+    except CustomError as exc:
+        raise HTTPException(status_code=exc.status_code, detail=str(exc))
+
+    return result
+
+
+@image_router.get('/{digest}')
+async def get_image(session: Annotated[AsyncSession, Depends(get_session)],
+                    store: Annotated[BlobStore, Depends(get_blob_store)],
+                    request: Request,
+                    digest: Annotated[str, Path(pattern=DIGEST_PATTERN)],
+                    ):
+    controller = ImageController(session=session, store=store)
+
+    try:
+        image, path = await controller.get_image(digest=digest)
+    except CustomError as exc:
+        raise HTTPException(status_code=exc.status_code, detail=str(exc))
+
+    return immutable_file_response(request, store, path, media_type=image.content_type, etag=digest)
+
+
+@image_router.get('/{digest}/thumbnail')
+async def get_thumbnail(session: Annotated[AsyncSession, Depends(get_session)],
+                        store: Annotated[BlobStore, Depends(get_blob_store)],
+                        request: Request,
+                        digest: Annotated[str, Path(pattern=DIGEST_PATTERN)],
+                        width: Annotated[int, Query(gt=0)] = 256,
+                        ):
+    controller = ImageController(session=session, store=store)
+
+    try:
+        path = await controller.get_thumbnail(digest=digest, width=width)
+    except CustomError as exc:
+        raise HTTPException(status_code=exc.status_code, detail=str(exc))
+
+    return immutable_file_response(request, store, path, media_type="image/webp", etag=f"{digest}-{width}")
@@ -0,0 +1,82 @@
+import json
+
+from sqlalchemy import select, desc
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from v1.database.functions import utc_now
+from v1.database.schemas import JobOrm
+from v1.exceptions.exceptions import ResourceNotFoundError, ValidationError
+from v1.jobs.config import JobSettings
+from v1.models.common import Pagination
+from v1.models.enums.job_status import JobStatus
+from v1.models.enums.job_type import JobType
+from v1.routers.jobs.models.job import JobOutput
+
+
+class JobController:
+    def __init__(self,
+                 session: AsyncSession,
+                 ):
+        self.session = session
+
+    async def enqueue(self,
+                      job_type: JobType,
+                      payload: dict,
+                      ) -> JobOutput:
+        """
+        Puts new job into queue. Job becomes visible to workers after commit
+        :param job_type: type of job handler
+        :param payload: keyword arguments of job handler
+        :return: created job
+        """
+        job = JobOrm(type=job_type, payload=json.dumps(payload), max_attempts=JobSettings().max_attempts)
+        self.session.add(job)
+        await self.session.flush()
+        await self.session.refresh(job)
+
+        return JobOutput.model_validate(job)
+
+    async def get_jobs(self,
+                       pagination: Pagination,
+                       status: JobStatus | None = None,
+                       ) -> list[JobOutput]:
+        query = select(JobOrm)
+        if status is not None:
+            query = query.where(JobOrm.status == status)
+        query = query.order_by(desc(JobOrm.id)).limit(pagination.limit).offset(pagination.offset)
+
+        jobs = await self.session.execute(query)
+        jobs = jobs.scalars().all()
+
+        return [JobOutput.model_validate(job) for job in jobs]
+
+    async def get_job(self, job_id: int) -> JobOutput:
+        job = await self.session.get(JobOrm, job_id)
+
+        if not job:
+            raise ResourceNotFoundError("Job with given id not exist!")
+
+        return JobOutput.model_validate(job)
+
+    async def retry_job(self, job_id: int) -> JobOutput:
+        """
+        Puts failed job back into queue with fresh attempts counter
+        :param job_id: id of failed job
+        :return: requeued job
+        """
+        job = await self.session.get(JobOrm, job_id, with_for_update=True)
+
+        if not job:
+            raise ResourceNotFoundError("Job with given id not exist!")
+        if job.status != JobStatus.FAILED:
+            raise ValidationError("Only failed jobs can be retried!")
+
+        job.status = JobStatus.QUEUED
+        job.attempts = 0
+        job.run_at = utc_now()
+        job.locked_at = None
+        job.finished_at = None
+        await self.session.flush()
+        await self.session.refresh(job)
+
+        return JobOutput.model_validate(job)
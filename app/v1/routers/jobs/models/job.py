@@ -0,0 +1,29 @@
+import json
+from datetime import datetime
+
+from pydantic import BaseModel, Field, ConfigDict, field_validator
+
+from v1.models.enums.job_status import JobStatus
+from v1.models.enums.job_type import JobType
+
+
+class JobOutput(BaseModel):
+    id: int = Field(gt=0)
+    type: JobType
+    payload: dict
+    status: JobStatus
+    attempts: int = Field(ge=0)
+    max_attempts: int = Field(gt=0)
+    last_error: str | None = None
+    run_at: datetime
+    created_at: datetime
+    finished_at: datetime | None = None
+    model_config = ConfigDict(from_attributes=True)
+
+    @field_validator('payload', mode='before')
+    @classmethod
+    def validate_payload(cls, value: str | dict):
+        if isinstance(value, str):
+            return json.loads(value)
+
+        return value
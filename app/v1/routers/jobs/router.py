@@ -0,0 +1,54 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, HTTPException, Path
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from v1.database.database import get_session
+from v1.exceptions.exceptions import CustomError
+from v1.models.common import Pagination
+from v1.models.enums.job_status import JobStatus
+from v1.routers.jobs.controller import JobController
+from v1.routers.jobs.models.job import JobOutput
+
+job_router = APIRouter(tags=["Background Jobs"])
+
+
+@job_router.get('/')
+async def get_jobs(session: Annotated[AsyncSession, Depends(get_session)],
+                   status: Annotated[JobStatus | None, Query()] = None,
+                   limit: Annotated[int, Query(gt=0)] = 20,
+                   offset: Annotated[int, Query(ge=0)] = 0,
+                   ) -> list[JobOutput]:
+    controller = JobController(session=session)
+    result = await controller.get_jobs(pagination=Pagination(limit=limit, offset=offset), status=status)
+
+    return result
+
+
+@job_router.get('/{job_id}')
+async def get_job(session: Annotated[AsyncSession, Depends(get_session)],
+                  job_id: Annotated[int, Path(gt=0)],
+                  ) -> JobOutput:
+    controller = JobController(session=session)
+
+    try:
+        result = await controller.get_job(job_id=job_id)
+    except CustomError as exc:
+        raise HTTPException(status_code=exc.status_code, detail=str(exc))
+
+    return result
+
+
+@job_router.post('/{job_id}/retry')
+async def retry_job(session: Annotated[AsyncSession, Depends(get_session)],
+                    job_id: Annotated[int, Path(gt=0)],
+                    ) -> JobOutput:
+    controller = JobController(session=session)
+
+    try:
+        result = await controller.retry_job(job_id=job_id)
+        await session.commit()
+    except CustomError as exc:
+        raise HTTPException(status_code=exc.status_code, detail=str(exc))
+
+    return result
@@ -2,11 +2,14 @@ from sqlalchemy import select, func, asc, desc, and_
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from v1.database.schemas import QuestOrm, TaskOrm, CompletionOrm
+from v1.database.schemas import QuestOrm, QuestVersionOrm, TaskOrm, CompletionOrm, ImageOrm
 from v1.exceptions.exceptions import DuplicateError, ValidationError, ResourceNotFoundError
 from v1.models.common import Sort, Pagination
+from v1.models.enums.job_type import JobType
+from v1.routers.jobs.controller import JobController
+from v1.routers.jobs.models.job import JobOutput
 from v1.routers.quests.models.quest import QuestOutput, QuestInput, QuestOutputExtended
-from v1.routers.quests.models.tasks import TaskOutput
+from v1.routers.quests.models.tasks import TaskOutput, ImageTaskInput
 
 
 class QuestController:
@@ -22,7 +25,7 @@ class QuestController:
         query = (select(QuestOrm,
                         func.count(TaskOrm.id).label('questions_number'),
                         func.count(CompletionOrm.id).label('completions_number'))
-                 .outerjoin(TaskOrm, TaskOrm.quest_id == QuestOrm.id)
+                 .outerjoin(TaskOrm, and_(TaskOrm.quest_id == QuestOrm.id, TaskOrm.version == QuestOrm.version))
                  .outerjoin(CompletionOrm, CompletionOrm.quest_id == QuestOrm.id)
                  .group_by(QuestOrm.id)
                  .limit(limit)
@@ -67,7 +70,8 @@ class QuestController:
         query = (select(QuestOrm,
                         func.count(TaskOrm.id).label('questionsNumber'),
                         func.count(CompletionOrm.id).label('completionsNumber'))
-                 .join(TaskOrm, TaskOrm.quest_id == QuestOrm.id, isouter=True)
+                 .join(TaskOrm, and_(TaskOrm.quest_id == QuestOrm.id, TaskOrm.version == QuestOrm.version),
+                       isouter=True)
                  .join(CompletionOrm, CompletionOrm.quest_id == QuestOrm.id, isouter=True)
                  .group_by(QuestOrm)
                  .limit(pagination.limit)
@@ -99,8 +103,10 @@ class QuestController:
         :param quest: quest info and tasks
         :return: same information with ids
         """
+        await self._check_images_exist(quest)
+
         # save Quest instance
-        quest_db = QuestOrm(**quest.model_dump(exclude={"tasks"}))
+        quest_db = QuestOrm(**quest.model_dump(exclude={"tasks"}), version=1)
 
         try:
             self.session.add(quest_db)
@@ -109,44 +115,160 @@ class QuestController:
         except IntegrityError:
             raise DuplicateError("Quest with this name already exists!")
 
-        # save Task instances
+        return await self._save_version(quest_db, quest)
+
+    async def update_quest(self,
+                           quest_id: int,
+                           quest: QuestInput
+                           ) -> QuestOutputExtended:
+        """
+        Creates new version of Quest with its own Task instances.
+        Previous versions stay untouched, so completions keep pointing to tasks they were taken with
+        :param quest_id: id of quest to edit
+        :param quest: new quest info and tasks
+        :return: created version
+        """
+        await self._check_images_exist(quest)
+
+        # lock latest version pointer, so concurrent edits get sequential versions
+        query = select(QuestOrm).where(QuestOrm.id == quest_id).with_for_update()
+        quest_db = await self.session.execute(query)
+        quest_db = quest_db.scalar()
+
+        if not quest_db:
+            raise ResourceNotFoundError("Quest with given id not exist!")
+
+        quest_db.name = quest.name
+        quest_db.description = quest.description
+        quest_db.version += 1
+
         try:
-            tasks = [TaskOrm(quest_id=quest_db.id, order=order, **task.model_dump())
-                     for order, task in enumerate(quest.tasks)]
-            self.session.add_all(tasks)
             await self.session.flush()
-            [await self.session.refresh(task) for task in tasks]
         except IntegrityError:
-            raise DuplicateError("Each question should be unique!")
+            raise DuplicateError("Quest with this name already exists!")
 
-        # return result
-        result = QuestOutputExtended.model_validate({
-            "id": quest_db.id,
-            "name": quest_db.name,
-            "description": quest_db.description,
-            "tasks": [TaskOutput.model_validate(t) for t in tasks],
-        })
+        return await self._save_version(quest_db, quest)
 
-        return result
+    async def get_latest_version(self, quest_id: int) -> int:
+        query = select(QuestOrm.version).where(QuestOrm.id == quest_id)
+        version = await self.session.execute(query)
+        version = version.scalar()
+
+        if not version:
+            raise ResourceNotFoundError("Quest with given id not exist!")
 
-    async def get_quest_info(self, quest_id: int):
-        query = select(QuestOrm).where(QuestOrm.id == quest_id)
+        return version
+
+    async def check_version_exists(self, quest_id: int, version: int) -> None:
+        query = select(QuestVersionOrm.id).where(QuestVersionOrm.quest_id == quest_id,
+                                                 QuestVersionOrm.version == version)
+        quest = await self.session.execute(query)
+
+        if not quest.scalar():
+            raise ResourceNotFoundError("Quest with given id and version not exist!")
+
+    async def get_quest_info(self,
+                             quest_id: int,
+                             version: int | None = None,
+                             ) -> QuestOutputExtended:
+        """
+        Returns quest with its tasks
+        :param quest_id: id of quest
+        :param version: version of quest, latest if not provided
+        :return: quest of given version
+        """
+        if version is None:
+            version = await self.get_latest_version(quest_id)
+
+        query = select(QuestVersionOrm).where(QuestVersionOrm.quest_id == quest_id,
+                                              QuestVersionOrm.version == version)
         quest = await self.session.execute(query)
         quest = quest.scalar()
 
         if not quest:
-            raise ResourceNotFoundError("Quest with given id not exist!")
+            raise ResourceNotFoundError("Quest with given id and version not exist!")
 
-        query = select(TaskOrm).where(TaskOrm.quest_id == quest_id).order_by(asc(TaskOrm.order),
-                                                                             asc(TaskOrm.id))
+        query = (select(TaskOrm)
+                 .where(TaskOrm.quest_id == quest_id, TaskOrm.version == version)
+                 .order_by(asc(TaskOrm.order), asc(TaskOrm.id)))
         tasks = await self.session.execute(query)
         tasks = tasks.scalars().all()
         tasks = [TaskOutput.model_validate(task) for task in tasks]
 
         quest = QuestOutputExtended.model_validate({
-            "id": quest.id,
+            "id": quest.quest_id,
+            "version": quest.version,
             "name": quest.name,
             "description": quest.description,
             "tasks": tasks})
 
         return quest
+
+    async def delete_quest(self, quest_id: int) -> JobOutput:
+        """
+        Schedules deletion of quest with all its tasks and completions
+        :param quest_id: id of quest to delete
+        :return: scheduled job
+        """
+        await self._check_quest_exists(quest_id)
+
+        return await JobController(session=self.session).enqueue(JobType.DELETE_QUEST, {"quest_id": quest_id})
+
+    async def recompute_rates(self, quest_id: int) -> JobOutput:
+        """
+        Schedules recalculation of rate of every quest completion
+        :param quest_id: id of quest
+        :return: scheduled job
+        """
+        await self._check_quest_exists(quest_id)
+
+        return await JobController(session=self.session).enqueue(JobType.RECOMPUTE_RATES, {"quest_id": quest_id})
+
+    async def _check_quest_exists(self, quest_id: int) -> None:
+        query = select(QuestOrm.id).where(QuestOrm.id == quest_id)
+        quest = await self.session.execute(query)
+
+        if not quest.scalar():
+            raise ResourceNotFoundError("Quest with given id not exist!")
+
+    async def _check_images_exist(self, quest: QuestInput) -> None:
+        # image tasks may reference images uploaded to blob store by digest
+        digests = set().union(*[task.get_image_digests() for task in quest.tasks
+                                if isinstance(task, ImageTaskInput)])
+        if not digests:
+            return
+
+        query = select(ImageOrm.digest).where(ImageOrm.digest.in_(digests))
+        existing = await self.session.execute(query)
+
+        if digests - set(existing.scalars().all()):
+            raise ValidationError("Image tasks reference images which were not uploaded!")
+
+    async def _save_version(self,
+                            quest_db: QuestOrm,
+                            quest: QuestInput,
+                            ) -> QuestOutputExtended:
+        # save immutable snapshot of quest and its Task instances
+        version_db = QuestVersionOrm(quest_id=quest_db.id, version=quest_db.version,
+                                     name=quest.name, description=quest.description)
+
+        try:
+            tasks = [TaskOrm(quest_id=quest_db.id, version=quest_db.version, order=order, **task.model_dump())
+                     for order, task in enumerate(quest.tasks)]
+            self.session.add(version_db)
+            self.session.add_all(tasks)
+            await self.session.flush()
+            [await self.session.refresh(task) for task in tasks]
+        except IntegrityError:
+            raise DuplicateError("Each question should be unique!")
+
+        # return result
+        result = QuestOutputExtended.model_validate({
+            "id": quest_db.id,
+            "version": quest_db.version,
+            "name": quest_db.name,
+            "description": quest_db.description,
+            "tasks": [TaskOutput.model_validate(t) for t in tasks],
+        })
+
+        return result
@@ -30,4 +30,5 @@ class QuestOutput(QuestBase):
 
 class QuestOutputExtended(QuestBase):
     id: Annotated[int, Field(gt=0)]
+    version: Annotated[int, Field(gt=0)]
     tasks: Annotated[list[TaskOutput], Field(min_length=1)]
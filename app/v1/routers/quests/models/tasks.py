@@ -1,10 +1,13 @@
 import json
+import re
 from typing import Annotated, Literal, Self
 
 from pydantic import BaseModel, Field, field_serializer, field_validator, ConfigDict, model_validator
 
 from v1.models.enums.task_type import TaskType
 
+IMAGE_DIGEST_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
 
 class TaskBase(BaseModel):
     question: Annotated[str, Field(min_length=1)]
@@ -68,6 +71,13 @@ class ImageTaskInput(TaskBase):
 
         return self
 
+    def get_image_digests(self) -> set[str]:
+        """
+        Returns responses which reference images uploaded to blob store
+        """
+        return {response for response in self.responses if IMAGE_DIGEST_PATTERN.match(response)}
+
+
 class MultipleTaskInput(TaskBase):
     type: Literal[TaskType.MULTIPLE]
 
@@ -86,5 +96,16 @@ class MultipleTaskInput(TaskBase):
 
 class TaskOutput(TaskBase):
     id: int = Field(gt=0)
+    type: TaskType
     order: int = Field(ge=0)
     model_config = ConfigDict(from_attributes=True)
+
+
+def is_answer_correct(answers: list[str], answer: list[str]) -> bool:
+    """
+    Checks user answer against correct answers of task
+    :param answers: correct answers
+    :param answer: answer given by user
+    :return: True if answer is correct
+    """
+    return set(answers) == set(answer)
@@ -1,11 +1,13 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query, Body, HTTPException, Path
+from fastapi import APIRouter, Depends, Query, Body, HTTPException, Path, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from v1.database.database import get_session
 from v1.exceptions.exceptions import CustomError
 from v1.models.common import Pagination, Sort
+from v1.routers.cache import IMMUTABLE_CACHE_CONTROL, REVALIDATE_CACHE_CONTROL, is_not_modified
+from v1.routers.jobs.models.job import JobOutput
 from v1.routers.quests.controller import QuestController
 from v1.routers.quests.models.quest import QuestInput, QuestOutput
 
@@ -53,14 +55,99 @@ async def get_quests_by_filters(session: Annotated[AsyncSession, Depends(get_ses
     return result
 
 
+def quest_etag(quest_id: int, version: int) -> str:
+    return f'"quest-{quest_id}-v{version}"'
+
+
 @quest_router.get('/{quest_id}')
 async def get_quest_expanded(session: Annotated[AsyncSession, Depends(get_session)],
+                             request: Request,
+                             response: Response,
                              quest_id: Annotated[int, Path(gt=0)],
                              ):
     controller = QuestController(session=session)
 
     try:
-        result = await controller.get_quest_info(quest_id=quest_id)
+        # only the latest version pointer is revalidated, content of version never changes
+        version = await controller.get_latest_version(quest_id=quest_id)
+        headers = {"cache-control": REVALIDATE_CACHE_CONTROL, "etag": quest_etag(quest_id, version)}
+        if is_not_modified(request, headers["etag"]):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        result = await controller.get_quest_info(quest_id=quest_id, version=version)
+    except CustomError as exc:
+        raise HTTPException(status_code=exc.status_code, detail=str(exc))
+
+    response.headers.update(headers)
+
+    return result
+
+
+@quest_router.put('/{quest_id}')
+async def update_quest(session: Annotated[AsyncSession, Depends(get_session)],
+                       quest_id: Annotated[int, Path(gt=0)],
+                       quest: Annotated[QuestInput, Body()],
+                       ):
+    controller = QuestController(session=session)
+
+    try:
+        result = await controller.update_quest(quest_id=quest_id, quest=quest)
+        await session.commit()
+    except CustomError as exc:
+        raise HTTPException(status_code=exc.status_code, detail=str(exc))
+
+    return result
+
+
+@quest_router.get('/{quest_id}/versions/{version}')
+async def get_quest_version(session: Annotated[AsyncSession, Depends(get_session)],
+                            request: Request,
+                            response: Response,
+                            quest_id: Annotated[int, Path(gt=0)],
+                            version: Annotated[int, Path(gt=0)],
+                            ):
+    controller = QuestController(session=session)
+
+    try:
+        # version may be deleted, so 304 is sent only for existing one
+        await controller.check_version_exists(quest_id=quest_id, version=version)
+        headers = {"cache-control": IMMUTABLE_CACHE_CONTROL, "etag": quest_etag(quest_id, version)}
+        if is_not_modified(request, headers["etag"]):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        result = await controller.get_quest_info(quest_id=quest_id, version=version)
+    except CustomError as exc:
+        raise HTTPException(status_code=exc.status_code, detail=str(exc))
+
+    response.headers.update(headers)
+
+    return result
+
+
+@quest_router.delete('/{quest_id}', status_code=status.HTTP_202_ACCEPTED)
+async def delete_quest(session: Annotated[AsyncSession, Depends(get_session)],
+                       quest_id: Annotated[int, Path(gt=0)],
+                       ) -> JobOutput:
+    controller = QuestController(session=session)
+
+    try:
+        result = await controller.delete_quest(quest_id=quest_id)
+        await session.commit()
+    except CustomError as exc:
+        raise HTTPException(status_code=exc.status_code, detail=str(exc))
+
+    return result
+
+
+@quest_router.post('/{quest_id}/recompute_rates', status_code=status.HTTP_202_ACCEPTED)
+async def recompute_rates(session: Annotated[AsyncSession, Depends(get_session)],
+                          quest_id: Annotated[int, Path(gt=0)],
+                          ) -> JobOutput:
+    controller = QuestController(session=session)
+
+    try:
+        result = await controller.recompute_rates(quest_id=quest_id)
+        await session.commit()
     except CustomError as exc:
         raise HTTPException(status_code=exc.status_code, detail=str(exc))
 
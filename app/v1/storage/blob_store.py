@@ -0,0 +1,122 @@
+import asyncio
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import AsyncIterator
+
+from PIL import Image, ImageOps
+from starlette.concurrency import run_in_threadpool
+
+from v1.exceptions.exceptions import PayloadTooLargeError
+
+
+class BlobStore:
+    """
+    Content-addressed file storage.
+    Every blob is saved under its sha256 digest, so equal files are stored only once
+    and stored files never change.
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        self._thumbnail_locks: dict[Path, asyncio.Lock] = {}
+
+    def blob_path(self, digest: str) -> Path:
+        return self.root / "blobs" / digest[:2] / digest[2:4] / digest
+
+    def thumbnail_path(self, digest: str, width: int) -> Path:
+        return self.root / "thumbnails" / str(width) / digest[:2] / digest[2:4] / f"{digest}.webp"
+
+    async def stage(self,
+                    chunks: AsyncIterator[bytes],
+                    max_size: int,
+                    ) -> tuple[str, int, Path]:
+        """
+        Writes incoming bytes into temporary file while hashing them
+        :param chunks: body chunks
+        :param max_size: max allowed size in bytes
+        :return: digest, size and path of temporary file
+        """
+        tmp_dir = self.root / "tmp"
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=tmp_dir)
+        tmp_path = Path(tmp_path)
+
+        hasher = hashlib.sha256()
+        size = 0
+        try:
+            with os.fdopen(fd, "wb") as file:
+                async for chunk in chunks:
+                    size += len(chunk)
+                    if size > max_size:
+                        raise PayloadTooLargeError(f"File exceeds {max_size} bytes!")
+                    hasher.update(chunk)
+                    await run_in_threadpool(file.write, chunk)
+        except BaseException:
+            self.discard(tmp_path)
+            raise
+
+        return hasher.hexdigest(), size, tmp_path
+
+    def commit(self, digest: str, tmp_path: Path) -> Path:
+        """
+        Moves staged file to its content address. Duplicates are dropped
+        :param digest: sha256 digest of file
+        :param tmp_path: path of staged file
+        :return: path of stored blob
+        """
+        path = self.blob_path(digest)
+        if path.exists():
+            self.discard(tmp_path)
+            return path
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(tmp_path, path)
+
+        return path
+
+    @staticmethod
+    def discard(tmp_path: Path) -> None:
+        tmp_path.unlink(missing_ok=True)
+
+    async def thumbnail(self, digest: str, width: int) -> Path:
+        """
+        Returns path of resized copy of image, generating it on first request
+        :param digest: sha256 digest of source image
+        :param width: width of thumbnail
+        :return: path of thumbnail
+        """
+        path = self.thumbnail_path(digest, width)
+        if path.exists():
+            return path
+
+        # concurrent requests for the same thumbnail render it only once
+        lock = self._thumbnail_locks.setdefault(path, asyncio.Lock())
+        try:
+            async with lock:
+                if not path.exists():
+                    await run_in_threadpool(self._render_thumbnail, self.blob_path(digest), path, width)
+        finally:
+            self._thumbnail_locks.pop(path, None)
+
+        return path
+
+    @staticmethod
+    def _render_thumbnail(source: Path, target: Path, width: int) -> None:
+        target.parent.mkdir(parents=True, exist_ok=True)
+
+        with Image.open(source) as image:
+            image = ImageOps.exif_transpose(image)
+            image = image.convert("RGBA" if image.has_transparency_data else "RGB")
+            image.thumbnail((width, image.height))
+
+            # write to temporary file first, so readers never see partially written thumbnail
+            fd, tmp_path = tempfile.mkstemp(dir=target.parent, suffix=".webp")
+            try:
+                with os.fdopen(fd, "wb") as file:
+                    image.save(file, format="WEBP")
+                os.replace(tmp_path, target)
+            except BaseException:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
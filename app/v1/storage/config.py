@@ -0,0 +1,13 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class StorageSettings(BaseSettings):
+    root: str = Field(min_length=1, default="./media")
+    max_image_size: int = Field(default=10 * 1024 * 1024, gt=0)
+    thumbnail_widths: list[int] = Field(default=[128, 256, 512])
+    # zero-copy serving: file bodies are handed off to nginx via X-Accel-Redirect,
+    # without it the app streams files in chunks itself
+    accel_redirect_prefix: str | None = Field(default=None)
+
+    model_config = SettingsConfigDict(env_prefix="v1_storage_")
@@ -0,0 +1,39 @@
+from pathlib import Path
+
+from starlette import status
+from starlette.requests import Request
+from starlette.responses import Response, FileResponse
+
+from v1.routers.cache import IMMUTABLE_CACHE_CONTROL, is_not_modified
+from v1.storage.blob_store import BlobStore
+from v1.storage.config import StorageSettings
+
+
+def immutable_file_response(request: Request,
+                            store: BlobStore,
+                            path: Path,
+                            media_type: str,
+                            etag: str,
+                            ) -> Response:
+    """
+    Serves file of blob store which content never changes under the same url.
+    With `accel_redirect_prefix` set, body is handed off to nginx, which sends it with sendfile (zero-copy).
+    Otherwise body is read in chunks and streamed by the app. Range requests are supported in both cases
+    :param request: incoming request
+    :param store: store owning the file
+    :param path: path of file
+    :param media_type: content type of file
+    :param etag: unique file identifier
+    :return: response
+    """
+    headers = {"cache-control": IMMUTABLE_CACHE_CONTROL, "etag": f'"{etag}"'}
+
+    if is_not_modified(request, headers["etag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    accel_redirect_prefix = StorageSettings().accel_redirect_prefix
+    if accel_redirect_prefix:
+        location = f"{accel_redirect_prefix.rstrip('/')}/{path.relative_to(store.root).as_posix()}"
+        return Response(headers=headers | {"x-accel-redirect": location}, media_type=media_type)
+
+    return FileResponse(path, media_type=media_type, headers=headers)
@@ -0,0 +1,9 @@
+from v1.storage.blob_store import BlobStore
+from v1.storage.config import StorageSettings
+
+
+blob_store = BlobStore(StorageSettings().root)
+
+
+def get_blob_store() -> BlobStore:
+    return blob_store